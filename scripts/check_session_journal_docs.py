@@ -143,12 +143,109 @@ def _read_tracked_text(
     return None
 
 
+@dataclass(frozen=True)
+class _ScopeRule:
+    line: int
+    entry: str
+    pattern: str
+    exclude: bool
+
+
+@dataclass(frozen=True)
+class _ScopeMatcher:
+    rules: tuple[_ScopeRule, ...]
+    regex: re.Pattern[str]
+
+    def hits(self, path: str) -> list[int]:
+        if not self.rules:
+            return []
+        match = self.regex.match(path)
+        if match is None:
+            return []
+        return [
+            int(name[1:])
+            for name, value in match.groupdict().items()
+            if value is not None
+        ]
+
+
+def _segment_regex(segment: str) -> str:
+    pieces: list[str] = []
+    index = 0
+    while index < len(segment):
+        character = segment[index]
+        index += 1
+        if character == "*":
+            while index < len(segment) and segment[index] == "*":
+                index += 1
+            pieces.append("[^/]*")
+        elif character == "?":
+            pieces.append("[^/]")
+        elif character == "[":
+            closing = index
+            if closing < len(segment) and segment[closing] == "!":
+                closing += 1
+            if closing < len(segment) and segment[closing] == "]":
+                closing += 1
+            closing = segment.find("]", closing)
+            if closing < 0:
+                pieces.append(re.escape(character))
+                continue
+            members = segment[index:closing]
+            index = closing + 1
+            negated = members.startswith("!")
+            if negated:
+                members = members[1:]
+            members = "".join(
+                "\\" + member if member in "\\[]^" else member
+                for member in members
+            )
+            pieces.append(
+                f"[^/{members}]" if negated else f"(?!/)[{members}]"
+            )
+        else:
+            pieces.append(re.escape(character))
+    return "".join(pieces)
+
+
+def _glob_regex(pattern: str) -> str:
+    parts = pattern.split("/")
+    pieces: list[str] = []
+    for index, part in enumerate(parts):
+        last = index == len(parts) - 1
+        if part == "**":
+            pieces.append(".+" if last else "(?:[^/]+/)*")
+        else:
+            pieces.append(_segment_regex(part) + ("" if last else "/"))
+    return "".join(pieces)
+
+
+def _compile_scope_rules(rules: list[_ScopeRule]) -> _ScopeMatcher:
+    # Each rule is an optional anchored lookahead, so one match reports every
+    # rule that accepts the path rather than only the first alternative.
+    alternatives = "".join(
+        f"(?:(?=(?P<r{index}>{_glob_regex(rule.pattern)})\\Z))?"
+        for index, rule in enumerate(rules)
+    )
+    return _ScopeMatcher(tuple(rules), re.compile(alternatives))
+
+
 def _scope_paths(
     repo_root: Path,
     scope_path: str,
     tracked: set[str],
+    directories: set[str],
     diagnostics: list[Diagnostic],
 ) -> list[str]:
+    """Select tracked Markdown from explicit paths and include/exclude rules.
+
+    Entries containing ``*``, ``?`` or ``[`` are globs (``**`` spans
+    directories), entries naming a tracked directory or ending in ``/`` are
+    directory rules, and a leading ``!`` excludes matches from the selection.
+    Excludes win regardless of order.  Explicit paths are resolved by set
+    membership; the remaining rules are compiled into one matcher and applied
+    to the tracked index in a single pass.
+    """
     normalized_scope = _normalize_repo_path(scope_path)
     if normalized_scope is None:
         diagnostics.append(Diagnostic(
@@ -169,13 +266,32 @@ def _scope_paths(
     if text is None:
         return []
 
-    selected: list[str] = []
-    seen: set[str] = set()
+    explicit: dict[str, list[int]] = {}
+    rules: list[_ScopeRule] = []
     for line_number, raw_line in enumerate(text.splitlines(), start=1):
         entry = raw_line.strip()
         if not entry or entry.startswith("#"):
             continue
-        normalized = _normalize_repo_path(entry)
+        exclude = entry.startswith("!")
+        body = entry[1:] if exclude else entry
+        if not body:
+            diagnostics.append(Diagnostic(
+                "INVALID_SCOPE_ENTRY",
+                normalized_scope,
+                line_number,
+                f"exclude entry has no pattern: {entry}",
+            ))
+            continue
+        is_glob = any(character in body for character in "*?[")
+        if is_glob and ".." in body.split("/"):
+            diagnostics.append(Diagnostic(
+                "INVALID_SCOPE_ENTRY",
+                normalized_scope,
+                line_number,
+                f"glob entry must not contain '..': {entry}",
+            ))
+            continue
+        normalized = _normalize_repo_path(body)
         if normalized is None:
             diagnostics.append(Diagnostic(
                 "INVALID_SCOPE_ENTRY",
@@ -184,6 +300,15 @@ def _scope_paths(
                 f"entry escapes repo: {entry}",
             ))
             continue
+        if body.endswith("/") or (
+            normalized in directories and normalized not in tracked
+        ):
+            pattern = "**" if normalized == "." else f"{normalized}/**"
+            rules.append(_ScopeRule(line_number, entry, pattern, exclude))
+            continue
+        if exclude or is_glob:
+            rules.append(_ScopeRule(line_number, entry, normalized, exclude))
+            continue
         if normalized not in tracked:
             diagnostics.append(Diagnostic(
                 "UNTRACKED_SCOPE_ENTRY",
@@ -200,10 +325,51 @@ def _scope_paths(
                 f"entry is not Markdown: {normalized}",
             ))
             continue
-        if normalized not in seen:
-            selected.append(normalized)
-            seen.add(normalized)
-    return selected
+        explicit.setdefault(normalized, []).append(line_number)
+
+    matcher = _compile_scope_rules(rules)
+    selected: set[str] = set()
+    credited: set[int] = set()
+    fully_removed: set[int] = set()
+    excluded_explicit: list[str] = []
+    for path in tracked:
+        if not path.lower().endswith(".md"):
+            continue
+        hits = matcher.hits(path)
+        includes = [index for index in hits if not rules[index].exclude]
+        if not includes and path not in explicit:
+            continue
+        if any(rules[index].exclude for index in hits):
+            fully_removed.update(includes)
+            if path in explicit:
+                excluded_explicit.append(path)
+            continue
+        credited.update(includes)
+        selected.add(path)
+
+    # Excludes that remove nothing are guards, not errors, so only include
+    # rules are reported.
+    for index, rule in enumerate(rules):
+        if rule.exclude or index in credited:
+            continue
+        if index in fully_removed:
+            code = "EXCLUDED_SCOPE_ENTRY"
+            detail = f"selection fully removed by exclude: {rule.entry}"
+        else:
+            code = "UNMATCHED_SCOPE_PATTERN"
+            detail = f"pattern selects no tracked Markdown: {rule.entry}"
+        diagnostics.append(Diagnostic(
+            code, normalized_scope, rule.line, detail
+        ))
+    for path in excluded_explicit:
+        for line_number in explicit[path]:
+            diagnostics.append(Diagnostic(
+                "EXCLUDED_SCOPE_ENTRY",
+                normalized_scope,
+                line_number,
+                f"selection fully removed by exclude: {path}",
+            ))
+    return sorted(selected)
 
 
 def _is_session_journal_markdown(path: str) -> bool:
@@ -386,7 +552,7 @@ def run_checks(
         selected = sorted(path for path in tracked if _is_session_journal_markdown(path))
     else:
         selected = _scope_paths(
-            repo_root, scope_path, tracked, diagnostics
+            repo_root, scope_path, tracked, directories, diagnostics
         )
 
     read_count = 0
@@ -418,7 +584,7 @@ def _arguments(argv: list[str]) -> argparse.Namespace:
     parser.add_argument(
         "--scope",
         default=DEFAULT_SCOPE.as_posix(),
-        help="tracked explicit scope file used by default mode",
+        help="tracked scope file of paths and include/exclude globs",
     )
     parser.add_argument(
         "--all-tracked",
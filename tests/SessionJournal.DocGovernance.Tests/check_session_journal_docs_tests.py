@@ -205,6 +205,183 @@ class SessionJournalDocCheckerTests(unittest.TestCase):
         self.assertIn("NON_MARKDOWN_SCOPE_ENTRY", result.stdout)
         self.assertNotIn("CHECKER_ERROR", result.stdout)
 
+    def test_glob_and_directory_rules_select_tracked_markdown(self) -> None:
+        self._install_fixture("all_tracked_noise")
+        archived = self.repo / "docs/SessionJournal/archive/old.md"
+        archived.parent.mkdir(parents=True)
+        archived.write_text("[gone](missing.md)\n", encoding="utf-8")
+        scope = self.repo / SCOPE_PATH
+        scope.write_text(
+            "docs/SessionJournal/**/*.md\n"
+            "!**/archive/**\n"
+            "!docs/SessionJournal/historical.md\n",
+            encoding="utf-8",
+        )
+        self._git("add", "--", ".")
+
+        result = self._run()
+
+        self.assertEqual(0, result.returncode, result.stdout + result.stderr)
+        self.assertIn("SUMMARY files=1 diagnostics=0 mode=scoped", result.stdout)
+
+    def test_directory_rule_includes_nested_markdown(self) -> None:
+        self._install_fixture("all_tracked_noise")
+        scope = self.repo / SCOPE_PATH
+        scope.write_text("docs/SessionJournal\n", encoding="utf-8")
+        self._git("add", "--", SCOPE_PATH)
+
+        result = self._run()
+
+        self.assertEqual(1, result.returncode)
+        self.assertIn(
+            "MISSING_TARGET docs/SessionJournal/historical.md:1", result.stdout
+        )
+        self.assertIn("SUMMARY files=2", result.stdout)
+
+    def test_invalid_and_unmatched_rules_keep_line_numbers(self) -> None:
+        self._install_fixture("valid")
+        scope = self.repo / SCOPE_PATH
+        scope.write_text(
+            "# comment\n"
+            "docs/SessionJournal/README.md\n"
+            "../outside/**/*.md\n"
+            "docs/SessionJournal/*.md\n"
+            "docs/missing/**/*.md\n"
+            "!**/archive/**\n"
+            "docs/SessionJournal/absent.md\n",
+            encoding="utf-8",
+        )
+        self._git("add", "--", SCOPE_PATH)
+
+        result = self._run()
+
+        self.assertEqual(1, result.returncode)
+        self.assertIn(f"INVALID_SCOPE_ENTRY {SCOPE_PATH}:3", result.stdout)
+        self.assertIn(f"UNMATCHED_SCOPE_PATTERN {SCOPE_PATH}:5", result.stdout)
+        self.assertNotIn(f"{SCOPE_PATH}:6", result.stdout)
+        self.assertIn(f"UNTRACKED_SCOPE_ENTRY {SCOPE_PATH}:7", result.stdout)
+        self.assertNotIn(f"{SCOPE_PATH}:4", result.stdout)
+
+    def _install_archived_scope(self, *entries: str) -> None:
+        self._install_fixture("valid")
+        archived = self.repo / "docs/SessionJournal/archive/y.md"
+        archived.parent.mkdir(parents=True)
+        archived.write_text("archived\n", encoding="utf-8")
+        scope = self.repo / SCOPE_PATH
+        scope.write_text("\n".join(entries) + "\n", encoding="utf-8")
+        self._git("add", "--", ".")
+
+    def test_excluded_explicit_entry_is_reported(self) -> None:
+        self._install_archived_scope(
+            "docs/SessionJournal/archive/y.md",
+            "docs/SessionJournal/README.md",
+            "!**/archive/**",
+        )
+
+        result = self._run()
+
+        self.assertEqual(1, result.returncode)
+        self.assertIn(
+            f"EXCLUDED_SCOPE_ENTRY {SCOPE_PATH}:1 selection fully removed",
+            result.stdout,
+        )
+        self.assertNotIn(f"{SCOPE_PATH}:3", result.stdout)
+        self.assertIn("SUMMARY files=1", result.stdout)
+
+    def test_fully_excluded_glob_is_not_reported_as_unmatched(self) -> None:
+        self._install_archived_scope(
+            "docs/SessionJournal/README.md",
+            "docs/SessionJournal/archive/*.md",
+            "!**/archive/**",
+        )
+
+        result = self._run()
+
+        self.assertEqual(1, result.returncode)
+        self.assertIn(f"EXCLUDED_SCOPE_ENTRY {SCOPE_PATH}:2", result.stdout)
+        self.assertNotIn("UNMATCHED_SCOPE_PATTERN", result.stdout)
+
+    def test_glob_entry_with_parent_segment_is_invalid(self) -> None:
+        self._install_fixture("valid")
+        scope = self.repo / SCOPE_PATH
+        scope.write_text(
+            "docs/SessionJournal/README.md\n"
+            "docs/*/../SessionJournal/target.md\n",
+            encoding="utf-8",
+        )
+        self._git("add", "--", SCOPE_PATH)
+
+        result = self._run()
+
+        self.assertEqual(1, result.returncode)
+        self.assertIn(f"INVALID_SCOPE_ENTRY {SCOPE_PATH}:2", result.stdout)
+        self.assertIn("SUMMARY files=1", result.stdout)
+
+
+    def _install_link_sources(self, pattern: str, *paths: str) -> None:
+        self._install_fixture("valid")
+        for path in paths:
+            source = self.repo / path
+            source.parent.mkdir(parents=True, exist_ok=True)
+            source.write_text("[probe](missing.md)\n", encoding="utf-8")
+        scope = self.repo / SCOPE_PATH
+        scope.write_text(pattern + "\n", encoding="utf-8")
+        self._git("add", "--", ".")
+
+    def test_negated_class_with_leading_bracket(self) -> None:
+        self._install_link_sources(
+            "docs/n/[!]x].md", "docs/n/q.md", "docs/n/].md", "docs/n/x.md"
+        )
+
+        result = self._run()
+
+        self.assertIn("MISSING_TARGET docs/n/q.md:1", result.stdout)
+        self.assertIn("SUMMARY files=1", result.stdout)
+
+    def test_class_with_leading_bracket(self) -> None:
+        self._install_link_sources(
+            "docs/n/[]x].md", "docs/n/q.md", "docs/n/].md", "docs/n/x.md"
+        )
+
+        result = self._run()
+
+        self.assertIn("MISSING_TARGET docs/n/].md:1", result.stdout)
+        self.assertIn("MISSING_TARGET docs/n/x.md:1", result.stdout)
+        self.assertIn("SUMMARY files=2", result.stdout)
+
+    def test_class_range_never_matches_separator(self) -> None:
+        self._install_link_sources(
+            "docs/a[+-0]b.md", "docs/a/b.md", "docs/a-b.md"
+        )
+
+        result = self._run()
+
+        self.assertIn("MISSING_TARGET docs/a-b.md:1", result.stdout)
+        self.assertIn("SUMMARY files=1", result.stdout)
+
+    def test_many_explicit_entries_select_each_tracked_file(self) -> None:
+        self._install_fixture("valid")
+        entries = ["docs/SessionJournal/README.md"]
+        for index in range(500):
+            path = f"docs/SessionJournal/many/doc-{index}.md"
+            source = self.repo / path
+            source.parent.mkdir(parents=True, exist_ok=True)
+            source.write_text("plain\n", encoding="utf-8")
+            entries.append(path)
+        entries.append("!docs/SessionJournal/many/doc-7.md")
+        scope = self.repo / SCOPE_PATH
+        scope.write_text("\n".join(entries) + "\n", encoding="utf-8")
+        self._git("add", "--", ".")
+
+        result = self._run()
+
+        self.assertEqual(1, result.returncode)
+        self.assertIn(
+            f"EXCLUDED_SCOPE_ENTRY {SCOPE_PATH}:9 selection fully removed",
+            result.stdout,
+        )
+        self.assertIn("SUMMARY files=500 diagnostics=1", result.stdout)
+
 
 if __name__ == "__main__":
     unittest.main()